@@ -1,12 +1,54 @@
+import asyncio
+import functools
 import os
 import json
+import re
+import threading
+import time
 import yt_dlp
-from typing import Dict, List, Optional, Any, Callable
+from typing import Dict, Iterator, List, Optional, Any, Callable, Tuple
 from dataclasses import dataclass
 from enum import Enum
+from concurrent.futures import ThreadPoolExecutor
 import tempfile
 from pathlib import Path
 
+# How long cached video metadata stays valid (seconds)
+INFO_CACHE_TTL = 300
+
+# Upper bound on cached info dicts; each can carry 40+ format entries, so an
+# unbounded cache pins serious memory on long-lived instances
+INFO_CACHE_MAX_ENTRIES = 64
+
+# Cheap shape check for YouTube URLs, used before any network validation
+_YT_RE = re.compile(
+    r'^https?://(?:www\.|m\.|music\.)?'
+    r'(?:youtube\.com/(?:watch\?v=|playlist\?list=|shorts/|channel/|@)|youtu\.be/)'
+    r'[\w\-]+'
+)
+
+# Lightweight metadata patterns for the ytInitialPlayerResponse blob in a
+# watch page, used by the async playlist path instead of full extraction
+_WATCH_TITLE_RE = re.compile(r'"title"\s*:\s*"((?:[^"\\]|\\.)*)"')
+_WATCH_LENGTH_RE = re.compile(r'"lengthSeconds"\s*:\s*"(\d+)"')
+_WATCH_AUTHOR_RE = re.compile(r'"author"\s*:\s*"((?:[^"\\]|\\.)*)"')
+
+
+@functools.lru_cache(maxsize=1)
+def _cached_extractors() -> tuple:
+    """Generate yt-dlp's ~1700 extractor classes once per process"""
+    return tuple(yt_dlp.extractor.gen_extractor_classes())
+
+
+def _json_unescape(match) -> str:
+    """Decode a JSON string captured from the watch-page HTML"""
+    if not match:
+        return ''
+    try:
+        return json.loads(f'"{match.group(1)}"')
+    except ValueError:
+        return match.group(1)
+
 
 class DownloadFormat(Enum):
     """Supported download formats"""
@@ -46,16 +88,25 @@ class DownloadProgress:
 class YouTubeDownloader:
     """Core YouTube downloader class using yt-dlp"""
     
-    def __init__(self, download_path: str = "./downloads"):
+    def __init__(self, download_path: str = "./downloads", max_workers: int = 8):
         """
         Initialize the YouTube downloader
-        
+
         Args:
             download_path: Directory where files will be downloaded
+            max_workers: Default thread count for concurrent metadata extraction
         """
         self.download_path = Path(download_path)
         self.download_path.mkdir(exist_ok=True)
+        # Persistent yt-dlp cache (player JS, signatures) so fresh processes
+        # skip the cold-start download/parse of YouTube's base.js
+        self.cachedir = self.download_path / ".yt-dlp-cache"
+        self.cachedir.mkdir(exist_ok=True)
+        self.max_workers = max_workers
         self.progress_callback: Optional[Callable[[DownloadProgress], None]] = None
+        self._info_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        self._info_cache_lock = threading.Lock()
+        self._tls = threading.local()
         
     def set_progress_callback(self, callback: Callable[[DownloadProgress], None]):
         """Set a callback function to receive progress updates"""
@@ -65,36 +116,107 @@ class YouTubeDownloader:
         """Internal progress hook for yt-dlp"""
         if not self.progress_callback:
             return
-            
-        progress = DownloadProgress(
-            status=d['status'],
-            percentage=0.0
-        )
-        
-        if d['status'] == 'downloading':
-            if 'total_bytes' in d and d['total_bytes']:
-                progress.percentage = (d['downloaded_bytes'] / d['total_bytes']) * 100
-            elif '_percent_str' in d:
-                # Extract percentage from string like "50.0%"
-                percent_str = d['_percent_str'].strip().rstrip('%')
-                try:
-                    progress.percentage = float(percent_str)
-                except (ValueError, AttributeError):
-                    progress.percentage = 0.0
-            
-            progress.speed = d.get('_speed_str', None)
-            progress.eta = d.get('_eta_str', None)
-            progress.filename = d.get('filename', None)
-            
-        elif d['status'] == 'finished':
-            progress.percentage = 100.0
-            progress.filename = d.get('filename', None)
-            
-        elif d['status'] == 'error':
-            progress.error_message = str(d.get('error', 'Unknown error'))
-            
-        self.progress_callback(progress)
-    
+
+        # This hook fires ~10x/second per download, so keep it flat:
+        # one pass of dict.get chains and a single constructor call
+        status = d['status']
+        downloaded = d.get('downloaded_bytes', 0)
+        total = d.get('total_bytes') or d.get('total_bytes_estimate') or 0
+
+        if status == 'finished':
+            percentage = 100.0
+        elif total:
+            percentage = (downloaded / total) * 100
+        else:
+            # Fall back to yt-dlp's preformatted string like " 50.0%" - it
+            # can also be " N/A%" or carry ANSI codes, so guard the parse
+            try:
+                percentage = float(d.get('_percent_str', '0').strip().rstrip('%') or 0)
+            except (ValueError, AttributeError):
+                percentage = 0.0
+
+        self.progress_callback(DownloadProgress(
+            status=status,
+            percentage=percentage,
+            speed=d.get('_speed_str'),
+            eta=d.get('_eta_str'),
+            filename=d.get('filename'),
+            error_message=str(d.get('error', 'Unknown error')) if status == 'error' else None
+        ))
+
+    def _get_ydl(self, opts: Dict[str, Any]) -> yt_dlp.YoutubeDL:
+        """
+        Return this thread's pooled YoutubeDL instance, reconfigured with opts
+
+        Constructing YoutubeDL reloads extractor classes and HTTP state on
+        every call, so one instance is kept per thread and its params are
+        reset to defaults and updated between calls. Used for metadata
+        extraction only; downloads still build a fresh instance because
+        progress hooks and postprocessors bind at construction time.
+
+        Args:
+            opts: yt-dlp options to apply for this call
+
+        Returns:
+            Reusable YoutubeDL instance for the current thread
+        """
+        ydl = getattr(self._tls, 'ydl', None)
+        if ydl is None:
+            ydl = yt_dlp.YoutubeDL({})
+            self._tls.base_params = dict(ydl.params)
+            self._tls.ydl = ydl
+
+        ydl.params.clear()
+        ydl.params.update(self._tls.base_params)
+        ydl.params.update(opts)
+        return ydl
+
+    def _get_raw_info(self, url: str) -> Dict[str, Any]:
+        """
+        Extract raw metadata for a URL, caching results for INFO_CACHE_TTL
+
+        Repeated calls for the same URL (validate -> info -> download) reuse
+        the cached info dict instead of paying another extraction round-trip.
+
+        Args:
+            url: YouTube video URL
+
+        Returns:
+            Raw yt-dlp info dictionary
+        """
+        cached = self._info_cache.get(url)
+        if cached and time.time() - cached[0] < INFO_CACHE_TTL:
+            return cached[1]
+
+        ydl_opts = {
+            'quiet': True,
+            'no_warnings': True,
+            'cachedir': str(self.cachedir),
+            # Manifests are only needed when actually downloading; skipping
+            # them here avoids megabytes of extra fetches (live streams
+            # especially) during the info phase
+            'youtube_include_dash_manifest': False,
+            'youtube_include_hls_manifest': False,
+        }
+
+        ydl = self._get_ydl(ydl_opts)
+        info = ydl.extract_info(url, download=False)
+
+        # Evict on insert: drop expired entries, then the oldest ones if
+        # the cache is still over its cap (playlist fan-out can insert many
+        # large info dicts in a burst)
+        now = time.time()
+        with self._info_cache_lock:
+            for key in [k for k, (ts, _) in self._info_cache.items()
+                        if now - ts >= INFO_CACHE_TTL]:
+                del self._info_cache[key]
+            while len(self._info_cache) >= INFO_CACHE_MAX_ENTRIES:
+                # Dicts iterate in insertion order, so this is the oldest
+                del self._info_cache[next(iter(self._info_cache))]
+            self._info_cache[url] = (now, info)
+
+        return info
+
     def get_video_info(self, url: str) -> VideoInfo:
         """
         Extract video information without downloading
@@ -108,95 +230,287 @@ class YouTubeDownloader:
         Raises:
             Exception: If video information cannot be extracted
         """
+        try:
+            info = self._get_raw_info(url)
+
+            # Handle playlist/channel URLs - get first video for info
+            if 'entries' in info:
+                if info['entries']:
+                    info = info['entries'][0]
+                else:
+                    raise Exception("No videos found in playlist/channel")
+
+            return VideoInfo(
+                id=info.get('id', ''),
+                title=info.get('title', 'Unknown Title'),
+                description=info.get('description', ''),
+                duration=info.get('duration', 0),
+                uploader=info.get('uploader', 'Unknown'),
+                upload_date=info.get('upload_date', ''),
+                view_count=info.get('view_count', 0),
+                thumbnail=info.get('thumbnail', ''),
+                # Keep yt-dlp's own format dicts (they already carry
+                # format_id/ext/quality/filesize/format_note and more);
+                # projecting 40+ of them per call was pure overhead
+                formats=info.get('formats', []),
+                url=url
+            )
+
+        except Exception as e:
+            raise Exception(f"Failed to extract video info: {str(e)}")
+    
+    def get_playlist_info(self, url: str, max_workers: Optional[int] = None) -> List[VideoInfo]:
+        """
+        Extract information from a playlist or channel
+
+        Entry metadata is fetched concurrently: a flat extraction first
+        collects the video IDs, then per-video details are resolved across
+        a thread pool (network-bound I/O, so threads work well here).
+
+        Args:
+            url: YouTube playlist or channel URL
+            max_workers: Number of threads used to fetch per-video details
+                (defaults to the value passed at construction)
+
+        Returns:
+            List of VideoInfo objects
+        """
+        if max_workers is None:
+            max_workers = self.max_workers
+
         ydl_opts = {
             'quiet': True,
             'no_warnings': True,
+            'extract_flat': True,  # Only extract basic info for speed
+            'cachedir': str(self.cachedir),
+            'youtube_include_dash_manifest': False,
+            'youtube_include_hls_manifest': False,
         }
-        
+
         try:
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                info = ydl.extract_info(url, download=False)
-                
-                # Handle playlist/channel URLs - get first video for info
-                if 'entries' in info:
-                    if info['entries']:
-                        info = info['entries'][0]
-                    else:
-                        raise Exception("No videos found in playlist/channel")
-                
-                return VideoInfo(
-                    id=info.get('id', ''),
-                    title=info.get('title', 'Unknown Title'),
-                    description=info.get('description', ''),
-                    duration=info.get('duration', 0),
-                    uploader=info.get('uploader', 'Unknown'),
-                    upload_date=info.get('upload_date', ''),
-                    view_count=info.get('view_count', 0),
-                    thumbnail=info.get('thumbnail', ''),
-                    formats=[
-                        {
-                            'format_id': f.get('format_id', ''),
-                            'ext': f.get('ext', ''),
-                            'quality': f.get('quality', ''),
-                            'filesize': f.get('filesize', 0),
-                            'format_note': f.get('format_note', '')
-                        }
-                        for f in info.get('formats', [])
-                    ],
-                    url=url
+            ydl = self._get_ydl(ydl_opts)
+            info = ydl.extract_info(url, download=False)
+
+            if 'entries' not in info:
+                # Single video, return as list
+                return [self.get_video_info(url)]
+
+            entries = [entry for entry in info['entries'] if entry]
+            video_urls = [
+                f"https://www.youtube.com/watch?v={entry.get('id', '')}"
+                for entry in entries
+            ]
+
+            # Fan out per-video extraction; fall back to the flat entry
+            # data when an individual video fails (private, deleted, ...)
+            def fetch(entry_and_url):
+                entry, video_url = entry_and_url
+                try:
+                    return self.get_video_info(video_url)
+                except Exception:
+                    return VideoInfo(
+                        id=entry.get('id', ''),
+                        title=entry.get('title', 'Unknown Title'),
+                        description='',  # Not available in flat extraction
+                        duration=entry.get('duration', 0),
+                        uploader=entry.get('uploader', 'Unknown'),
+                        upload_date='',
+                        view_count=0,
+                        thumbnail=entry.get('thumbnail', ''),
+                        formats=[],
+                        url=video_url
+                    )
+
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                videos = list(executor.map(fetch, zip(entries, video_urls)))
+
+            return videos
+
+        except Exception as e:
+            raise Exception(f"Failed to extract playlist info: {str(e)}")
+
+    def iter_playlist_info(self, url: str, limit: Optional[int] = None) -> Iterator[VideoInfo]:
+        """
+        Lazily iterate over playlist entries as VideoInfo objects
+
+        Extracts with process=False, so the extractor's 'entries' is a real
+        generator and playlist pages are only fetched as entries are
+        consumed; a caller that stops after the first few entries never
+        pays for the rest of the playlist. Entries carry the extractor's
+        unprocessed flat metadata only (no formats/description).
+
+        Args:
+            url: YouTube playlist or channel URL
+            limit: Stop after this many entries (None for all)
+
+        Yields:
+            VideoInfo objects with flat metadata
+        """
+        ydl_opts = {
+            'quiet': True,
+            'no_warnings': True,
+            'cachedir': str(self.cachedir),
+            'youtube_include_dash_manifest': False,
+            'youtube_include_hls_manifest': False,
+        }
+
+        try:
+            ydl = self._get_ydl(ydl_opts)
+            # process=False skips __process_playlist, which would otherwise
+            # drain the entries generator (fetching every page) up front
+            info = ydl.extract_info(url, download=False, process=False)
+        except Exception as e:
+            raise Exception(f"Failed to extract playlist info: {str(e)}")
+
+        if not info or 'entries' not in info:
+            # Single video
+            yield self.get_video_info(url)
+            return
+
+        count = 0
+        try:
+            for entry in info['entries']:
+                if not entry:
+                    continue
+                if limit is not None and count >= limit:
+                    return
+                yield VideoInfo(
+                    id=entry.get('id', ''),
+                    title=entry.get('title', 'Unknown Title'),
+                    description='',  # Not available in flat extraction
+                    duration=entry.get('duration', 0),
+                    uploader=entry.get('uploader', 'Unknown'),
+                    upload_date='',
+                    view_count=0,
+                    thumbnail=entry.get('thumbnail', ''),
+                    formats=[],
+                    url=entry.get('url') or f"https://www.youtube.com/watch?v={entry.get('id', '')}"
                 )
-                
+                count += 1
         except Exception as e:
-            raise Exception(f"Failed to extract video info: {str(e)}")
-    
-    def get_playlist_info(self, url: str) -> List[VideoInfo]:
+            # The generator fetches further playlist pages as it goes, so
+            # network failures can surface mid-iteration
+            raise Exception(f"Failed to extract playlist info: {str(e)}")
+
+    async def _fetch_entry_meta(self, session, semaphore, video_id: str) -> VideoInfo:
         """
-        Extract information from a playlist or channel
-        
+        Fetch lightweight metadata for one video via its watch page
+
+        Args:
+            session: aiohttp ClientSession to reuse for the GET
+            semaphore: Concurrency limiter shared across the playlist
+            video_id: YouTube video ID
+
+        Returns:
+            VideoInfo with title/duration/uploader (no formats/description)
+        """
+        url = f"https://www.youtube.com/watch?v={video_id}"
+        async with semaphore:
+            async with session.get(url) as response:
+                html = await response.text()
+
+        length = _WATCH_LENGTH_RE.search(html)
+        return VideoInfo(
+            id=video_id,
+            title=_json_unescape(_WATCH_TITLE_RE.search(html)) or 'Unknown Title',
+            description='',  # Not fetched on the lightweight path
+            duration=int(length.group(1)) if length else 0,
+            uploader=_json_unescape(_WATCH_AUTHOR_RE.search(html)) or 'Unknown',
+            upload_date='',
+            view_count=0,
+            thumbnail=f"https://i.ytimg.com/vi/{video_id}/hqdefault.jpg",
+            formats=[],
+            url=url
+        )
+
+    async def get_playlist_info_async(self, url: str, max_concurrency: int = 20) -> List[VideoInfo]:
+        """
+        Extract playlist information by fetching watch pages concurrently
+
+        Lighter alternative to get_playlist_info: instead of a full yt-dlp
+        extraction per entry, each video's watch page is fetched with
+        aiohttp and title/duration/uploader are parsed out of the embedded
+        player response. The semaphore bounds concurrency to stay clear of
+        YouTube rate limits.
+
         Args:
             url: YouTube playlist or channel URL
-            
+            max_concurrency: Maximum simultaneous watch-page requests
+
         Returns:
-            List of VideoInfo objects
+            List of VideoInfo objects (formats/description not populated)
         """
+        try:
+            import aiohttp
+        except ImportError:
+            raise Exception("aiohttp is required for get_playlist_info_async (pip install aiohttp)")
+
         ydl_opts = {
             'quiet': True,
             'no_warnings': True,
             'extract_flat': True,  # Only extract basic info for speed
+            'cachedir': str(self.cachedir),
+            'youtube_include_dash_manifest': False,
+            'youtube_include_hls_manifest': False,
         }
-        
+
+        loop = asyncio.get_running_loop()
+
+        def extract_flat():
+            return self._get_ydl(ydl_opts).extract_info(url, download=False)
+
         try:
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                info = ydl.extract_info(url, download=False)
-                
-                if 'entries' not in info:
-                    # Single video, return as list
-                    return [self.get_video_info(url)]
-                
-                videos = []
-                for entry in info['entries']:
-                    if entry:
-                        # Create basic VideoInfo from playlist entry
-                        video_info = VideoInfo(
-                            id=entry.get('id', ''),
-                            title=entry.get('title', 'Unknown Title'),
-                            description='',  # Not available in flat extraction
-                            duration=entry.get('duration', 0),
-                            uploader=entry.get('uploader', 'Unknown'),
-                            upload_date='',
-                            view_count=0,
-                            thumbnail=entry.get('thumbnail', ''),
-                            formats=[],
-                            url=f"https://www.youtube.com/watch?v={entry.get('id', '')}"
-                        )
-                        videos.append(video_info)
-                
-                return videos
-                
+            info = await loop.run_in_executor(None, extract_flat)
+
+            if 'entries' not in info:
+                # Single video, return as list
+                return [await loop.run_in_executor(None, self.get_video_info, url)]
+
+            video_ids = [
+                entry['id'] for entry in info['entries']
+                if entry and entry.get('id')
+            ]
+
+            semaphore = asyncio.Semaphore(max_concurrency)
+            async with aiohttp.ClientSession() as session:
+                return list(await asyncio.gather(*[
+                    self._fetch_entry_meta(session, semaphore, video_id)
+                    for video_id in video_ids
+                ]))
+
         except Exception as e:
             raise Exception(f"Failed to extract playlist info: {str(e)}")
-    
-    def download_video(self, url: str, format_choice: DownloadFormat = DownloadFormat.MP4_BEST, 
+
+    def _selected_audio_ext(self, url: str) -> Optional[str]:
+        """
+        Ext of the audio stream the MP3_BEST selector would download
+
+        Mirrors "bestaudio[ext=m4a]/bestaudio": prefer the best audio-only
+        m4a format, otherwise the best audio-only format overall.
+
+        Args:
+            url: YouTube video URL
+
+        Returns:
+            Ext of the selected audio stream, or None if it can't be resolved
+        """
+        info = self._get_raw_info(url)
+        if 'entries' in info:
+            info = info['entries'][0]
+
+        audio = [
+            f for f in info.get('formats', [])
+            if f.get('acodec') not in (None, 'none')
+            and f.get('vcodec') in (None, 'none')
+        ]
+        if not audio:
+            return None
+
+        pool = [f for f in audio if f.get('ext') == 'm4a'] or audio
+        best = max(pool, key=lambda f: f.get('abr') or f.get('tbr') or 0)
+        return best.get('ext')
+
+    def download_video(self, url: str, format_choice: DownloadFormat = DownloadFormat.MP4_BEST,
                       output_filename: Optional[str] = None) -> str:
         """
         Download a video from YouTube
@@ -222,74 +536,87 @@ class YouTubeDownloader:
             'format': format_choice.value,
             'outtmpl': output_template,
             'progress_hooks': [self._progress_hook],
+            # Fetch HLS/DASH fragments in parallel (no-op for progressive MP4)
+            'concurrent_fragment_downloads': 8,
+            'http_chunk_size': 10 * 1024 * 1024,
+            'cachedir': str(self.cachedir),
         }
         
-        # Special handling for audio-only downloads
-        if format_choice in [DownloadFormat.MP3_BEST, DownloadFormat.AUDIO_ONLY]:
-            ydl_opts['postprocessors'] = [{
-                'key': 'FFmpegExtractAudio',
-                'preferredcodec': 'mp3',
-                'preferredquality': '192',
-            }]
-        
         try:
+            # Only transcode to MP3 when the user asked for MP3 and the
+            # source is not already one; AUDIO_ONLY keeps the native audio
+            # stream, skipping a CPU-bound ffmpeg decode+encode pass
+            extract_audio = (format_choice == DownloadFormat.MP3_BEST
+                             and self._selected_audio_ext(url) != 'mp3')
+            if extract_audio:
+                ydl_opts['postprocessors'] = [{
+                    'key': 'FFmpegExtractAudio',
+                    'preferredcodec': 'mp3',
+                    'preferredquality': '192',
+                }]
+
             with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                ydl.download([url])
-                
-                # Get the actual filename of the downloaded file
-                info = ydl.extract_info(url, download=False)
+                # One call downloads and returns the post-download info, so
+                # prepare_filename reflects the format this instance actually
+                # selected (the cached metadata uses yt-dlp's default format
+                # and can resolve to a different ext)
+                info = ydl.extract_info(url, download=True)
                 if 'entries' in info:
                     info = info['entries'][0]
-                
-                # Construct expected filename
-                if output_filename:
-                    expected_file = self.download_path / output_filename
-                else:
-                    title = info.get('title', 'video')
-                    # Clean title for filename
-                    clean_title = "".join(c for c in title if c.isalnum() or c in (' ', '-', '_')).strip()
-                    if format_choice in [DownloadFormat.MP3_BEST, DownloadFormat.AUDIO_ONLY]:
-                        expected_file = self.download_path / f"{clean_title}.mp3"
-                    else:
-                        expected_file = self.download_path / f"{clean_title}.mp4"
-                
-                return str(expected_file)
-                
+
+                filename = ydl.prepare_filename(info)
+                if extract_audio:
+                    # The FFmpegExtractAudio postprocessor rewrites the ext
+                    filename = os.path.splitext(filename)[0] + '.mp3'
+
+                return filename
+
         except Exception as e:
             raise Exception(f"Download failed: {str(e)}")
     
-    def validate_url(self, url: str) -> bool:
+    def validate_url(self, url: str, strict: bool = False) -> bool:
         """
         Validate if URL is a valid YouTube URL
-        
+
+        The default check is a compiled-regex shape test, cheap enough to
+        run on every keystroke. Pass strict=True to actually resolve the
+        URL over the network (e.g. to catch deleted/private videos).
+
         Args:
             url: URL to validate
-            
+            strict: Also verify the URL resolves via yt-dlp
+
         Returns:
             True if valid, False otherwise
         """
+        if not _YT_RE.match(url):
+            return False
+        if not strict:
+            return True
+
         try:
-            ydl_opts = {'quiet': True, 'no_warnings': True}
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                ydl.extract_info(url, download=False)
-                return True
+            # Successful extraction lands in the cache, so a follow-up
+            # get_video_info/download_video for the same URL is free
+            self._get_raw_info(url)
+            return True
         except:
             return False
     
     def get_supported_sites(self) -> List[str]:
         """Get list of supported sites from yt-dlp"""
-        return list(yt_dlp.extractor.gen_extractor_classes())
+        return list(_cached_extractors())
 
 
 # Factory function for easy instantiation
-def create_downloader(download_path: str = "./downloads") -> YouTubeDownloader:
+def create_downloader(download_path: str = "./downloads", max_workers: int = 8) -> YouTubeDownloader:
     """
     Factory function to create a YouTubeDownloader instance
-    
+
     Args:
         download_path: Directory where files will be downloaded
-        
+        max_workers: Default thread count for concurrent metadata extraction
+
     Returns:
         YouTubeDownloader instance
     """
-    return YouTubeDownloader(download_path)
\ No newline at end of file
+    return YouTubeDownloader(download_path, max_workers=max_workers)
\ No newline at end of file
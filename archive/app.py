@@ -1,12 +1,48 @@
 import streamlit as st
 import yt_dlp as youtube_dl
 import os
+import shutil
 from pathlib import Path
-from PIL import Image
-from io import BytesIO
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Shared session so thumbnail GETs reuse keep-alive connections to
+# i.ytimg.com instead of paying a TCP+TLS handshake per request
+_SESSION = requests.Session()
+_SESSION.mount('https://', HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=20,
+    max_retries=Retry(total=2, backoff_factor=0.3),
+))
+
+# Streamlit serves <entrypoint dir>/static at /app/static via Tornado, which
+# honours HTTP Range headers. Needs server.enableStaticServing = true, i.e.
+# the repo-root .streamlit/config.toml (launch the server from the repo root)
+STATIC_DIR = Path(__file__).parent / "static"
+
+# Function to expose a downloaded file without buffering it in memory
+def publish_for_download(filepath):
+    STATIC_DIR.mkdir(exist_ok=True)
+    target = STATIC_DIR / filepath.name
+    # Always refresh the link: yt-dlp renames its .part file into place, so
+    # a re-download with the same name is a new inode and a previously
+    # published link would keep serving the old bytes
+    target.unlink(missing_ok=True)
+    try:
+        os.link(filepath, target)  # hardlink: no copy, no extra space
+    except OSError:
+        shutil.copyfile(filepath, target)
+    return f"app/static/{target.name}"
+
+# Function to fetch a thumbnail, memoized by URL so reruns don't re-download
+@st.cache_data(ttl=3600, show_spinner=False)
+def _fetch_thumb(url):
+    return _SESSION.get(url, timeout=5).content
 
 # Function to fetch video/playlist details and formats
+# (cached so reruns from widget interaction don't re-extract)
+@st.cache_data(ttl=600, show_spinner=False)
 def fetch_details(video_url):
     ydl_opts = {'quiet': True}
     with youtube_dl.YoutubeDL(ydl_opts) as ydl:
@@ -32,6 +68,9 @@ def download_media(video_url, format_id, is_audio, progress_callback):
         'format': 'bestvideo[ext=mp4]+bestaudio[ext=m4a]/best' if not is_audio else format_id,
         'outtmpl': 'downloads/%(title)s.%(ext)s',
         'progress_hooks': [progress_callback],
+        # Fetch HLS/DASH fragments in parallel (no-op for progressive MP4)
+        'concurrent_fragment_downloads': 8,
+        'http_chunk_size': 10 * 1024 * 1024,
     }
     if is_audio:
         ydl_opts['postprocessors'] = [{
@@ -86,20 +125,20 @@ if video_url.strip():
                         st.success(status)
             else:  # Single video
                 st.success(f"Video found: {details['title']}")
-                response = requests.get(details['thumbnail'])
-                thumbnail = Image.open(BytesIO(response.content))
-                st.image(thumbnail, caption=details['title'], use_column_width=True)
+                st.image(_fetch_thumb(details['thumbnail']), caption=details['title'], use_column_width=True)
 
                 # Audio or Video option
                 is_audio = st.checkbox("Download audio only (MP3)?")
 
-                # Dropdown for format selection
-                format_options = [
-                    f"{f['resolution']} ({f['ext']}) - {f['filesize'] or 'Unknown size'} bytes"
-                    for f in details['formats']
-                ]
-                selected_format = st.selectbox("Select Format:", options=format_options, index=0)
-                selected_format_id = details['formats'][format_options.index(selected_format)]["format_id"]
+                # Dropdown for format selection; the format dict itself is the
+                # option value, so no index() scan is needed to recover it
+                selected_fmt = st.selectbox(
+                    "Select Format:",
+                    options=details['formats'],
+                    index=0,
+                    format_func=lambda f: f"{f['resolution']} ({f['ext']}) - {f['filesize'] or 'Unknown size'} bytes"
+                )
+                selected_format_id = selected_fmt["format_id"]
 
                 # Progress bar
                 progress = st.progress(0)
@@ -119,12 +158,22 @@ if video_url.strip():
                         status, filepath = download_media(video_url, selected_format_id, is_audio, progress_hook)
                         if filepath:
                             st.success(status)
-                            with open(filepath, "rb") as f:
+                            if is_audio:
+                                # Audio files are small enough to buffer
                                 st.download_button(
                                     label="Download File",
-                                    data=f,
+                                    data=filepath.read_bytes(),
                                     file_name=filepath.name,
-                                    mime=f"audio/mp3" if is_audio else f"video/{filepath.suffix.lstrip('.')}"
+                                    mime="audio/mp3"
+                                )
+                            else:
+                                # Serve video via the static route so the
+                                # browser streams it (206 Partial Content)
+                                # instead of loading gigabytes into RAM
+                                href = publish_for_download(filepath)
+                                st.markdown(
+                                    f'<a href="{href}" download>Download File</a>',
+                                    unsafe_allow_html=True
                                 )
                         else:
                             st.error(status)
@@ -1,10 +1,16 @@
 import streamlit as st
 import os
+import queue
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-import tempfile
 from api import YouTubeDownloader, DownloadFormat, VideoInfo, DownloadProgress
 
+try:
+    from streamlit_autorefresh import st_autorefresh
+except ImportError:
+    st_autorefresh = None
+
 # Page configuration
 st.set_page_config(
     page_title="YouTube Downloader",
@@ -12,18 +18,34 @@ st.set_page_config(
     layout="wide"
 )
 
+@st.cache_resource
+def get_executor() -> ThreadPoolExecutor:
+    """Shared thread pool so downloads run off the script thread"""
+    return ThreadPoolExecutor(max_workers=4)
+
 # Initialize session state
 if 'downloader' not in st.session_state:
-    # Create downloads directory in temp folder for demo
-    downloads_dir = Path(tempfile.gettempdir()) / "youtube_downloads"
+    # One downloader per session: the progress callback and worker-count
+    # setting are session-scoped mutable state, so sharing an instance
+    # across sessions would cross-deliver progress updates. session_state
+    # outlives reruns, so the pooled yt-dlp state is still reused within
+    # the session. Project-local downloads dir so the yt-dlp cache
+    # survives restarts (tempfile.gettempdir() is wiped on redeploys).
+    downloads_dir = Path(__file__).parent / "downloads"
     st.session_state.downloader = YouTubeDownloader(str(downloads_dir))
     st.session_state.download_progress = None
     st.session_state.video_info = None
     st.session_state.is_downloading = False
+    st.session_state.download_future = None
+    st.session_state.progress_queue = queue.Queue()
+
+# The hook runs on the download thread; session_state is not thread-safe,
+# so updates go through a queue drained by the script thread
+_progress_queue = st.session_state.progress_queue
 
 def progress_callback(progress: DownloadProgress):
-    """Callback function to update progress in session state"""
-    st.session_state.download_progress = progress
+    """Callback function to push progress updates onto the queue"""
+    _progress_queue.put_nowait(progress)
 
 # Set up progress callback
 st.session_state.downloader.set_progress_callback(progress_callback)
@@ -49,7 +71,17 @@ with st.sidebar:
         options=list(format_options.keys()),
         index=0
     )
-    
+
+    # Playlist metadata is fetched concurrently; more workers = faster info
+    playlist_workers = st.slider(
+        "Playlist fetch workers:",
+        min_value=1,
+        max_value=16,
+        value=8,
+        help="Threads used to fetch per-video details for playlists/channels"
+    )
+    st.session_state.downloader.max_workers = playlist_workers
+
     # Download location info
     st.info(f"📁 Downloads will be saved to:\n`{st.session_state.downloader.download_path}`")
 
@@ -66,11 +98,16 @@ with col1:
         help="Supports single videos, playlists, and channels"
     )
     
+    # Cheap regex check (no network) so the buttons react as the user types
+    url_looks_valid = bool(url_input) and st.session_state.downloader.validate_url(url_input)
+    if url_input and not url_looks_valid:
+        st.warning("This doesn't look like a YouTube URL")
+
     # Action buttons
     col_btn1, col_btn2, col_btn3 = st.columns(3)
-    
+
     with col_btn1:
-        if st.button("🔍 Get Info", disabled=not url_input):
+        if st.button("🔍 Get Info", disabled=not url_looks_valid):
             if url_input:
                 try:
                     with st.spinner("Extracting video information..."):
@@ -88,27 +125,21 @@ with col1:
                     st.error(f"Error: {str(e)}")
     
     with col_btn2:
-        if st.button("⬬ Download", disabled=not url_input or st.session_state.is_downloading):
+        if st.button("⬬ Download", disabled=not url_looks_valid or st.session_state.is_downloading):
             if url_input:
                 st.session_state.is_downloading = True
                 st.session_state.download_progress = None
-                
-                try:
-                    format_choice = format_options[selected_format]
-                    
-                    with st.spinner("Starting download..."):
-                        downloaded_file = st.session_state.downloader.download_video(
-                            url_input, 
-                            format_choice
-                        )
-                    
-                    st.success(f"✅ Download completed!\nFile: {downloaded_file}")
-                    
-                except Exception as e:
-                    st.error(f"Download failed: {str(e)}")
-                finally:
-                    st.session_state.is_downloading = False
-    
+
+                # Run the download on the shared executor so the script
+                # thread stays free to render progress updates
+                format_choice = format_options[selected_format]
+                st.session_state.download_future = get_executor().submit(
+                    st.session_state.downloader.download_video,
+                    url_input,
+                    format_choice
+                )
+                st.rerun()
+
     with col_btn3:
         if st.button("🗑️ Clear"):
             st.session_state.video_info = None
@@ -116,6 +147,25 @@ with col1:
             url_input = ""
             st.rerun()
 
+# Check on the background download (if any)
+if st.session_state.is_downloading and st.session_state.download_future:
+    if st.session_state.download_future.done():
+        try:
+            downloaded_file = st.session_state.download_future.result()
+            st.success(f"✅ Download completed!\nFile: {downloaded_file}")
+        except Exception as e:
+            st.error(f"Download failed: {str(e)}")
+        finally:
+            st.session_state.is_downloading = False
+            st.session_state.download_future = None
+
+# Drain queued progress updates and keep only the latest
+while not _progress_queue.empty():
+    try:
+        st.session_state.download_progress = _progress_queue.get_nowait()
+    except queue.Empty:
+        break
+
 # Progress display
 if st.session_state.is_downloading and st.session_state.download_progress:
     progress = st.session_state.download_progress
@@ -141,12 +191,10 @@ if st.session_state.is_downloading and st.session_state.download_progress:
             st.text(f"Downloading: {Path(progress.filename).name}")
     
     elif progress.status == "finished":
-        st.success("✅ Download completed!")
-        st.session_state.is_downloading = False
-    
+        st.info("⏳ Finalizing download...")
+
     elif progress.status == "error":
         st.error(f"❌ Download failed: {progress.error_message}")
-        st.session_state.is_downloading = False
 
 with col2:
     # Video information display
@@ -211,5 +259,9 @@ st.markdown(
 
 # Auto-refresh for progress updates
 if st.session_state.is_downloading:
-    time.sleep(0.5)
-    st.rerun()
\ No newline at end of file
+    if st_autorefresh:
+        st_autorefresh(interval=500, key="download_poll")
+    else:
+        # Fallback busy-wait when streamlit-autorefresh is not installed
+        time.sleep(0.5)
+        st.rerun()
\ No newline at end of file